@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
+import glob
+import hashlib
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from utils.calculations import standardize_exercise_name, calculate_1rm
+from utils.calculations import standardize_exercise_series, calculate_1rm_vec, get_month_codes, get_week_codes
 
 
 #######################
@@ -13,6 +17,42 @@ from utils.calculations import standardize_exercise_name, calculate_1rm
 class DataProcessor:
     """Class for loading and processing workout data"""
     
+    # Names of the dataframes returned by load_data, used for cache files
+    cache_names = ('combined', 'hevy', 'strong', 'jefit')
+    
+    # Bump whenever the processed columns change so stale caches are not reused
+    cache_version = 8
+    
+    # Workout apps that data can come from, used as categories of the `source` column
+    # (kept alphabetical so grouped results stay in the same order as before)
+    source_names = ['Hevy', 'Jefit', 'Strong']
+    
+    # Raw columns needed from each source; everything else is skipped while parsing
+    source_columns = {
+        'hevy': ['start_time', 'exercise_title', 'weight_kg', 'reps', 'set_index'],
+        'strong': ['Date', 'Exercise Name', 'Weight', 'Reps', 'Set Order'],
+        'jefit': ['mydate', 'ename', 'logs']
+    }
+    
+    # Text columns are read as Arrow-backed strings so the string kernels work on contiguous buffers
+    source_string_columns = {
+        'hevy': ['exercise_title'],
+        'strong': ['Exercise Name'],
+        'jefit': ['ename', 'logs']
+    }
+    
+    # Date column and format of each source; dates are read as text and parsed afterwards so that
+    # a blank or malformed cell only drops that row instead of failing the whole file
+    source_date_columns = {
+        'hevy': ('start_time', '%d %b %Y, %H:%M'),
+        'strong': ('Date', 'ISO8601'),
+        'jefit': ('mydate', 'ISO8601')
+    }
+    
+    # Files larger than this are parsed in batches of `csv_batch_rows` rows to bound peak memory
+    large_file_bytes = 100 * 1024 * 1024
+    csv_batch_rows = 100_000
+    
     def __init__(self):
         """Initialize the data processor with data directories"""
         self.data_dir = "data"
@@ -65,8 +105,8 @@ class DataProcessor:
         except Exception:
             return None
 
-    def load_data(self):
-        """Load and process data from CSV files"""
+    def get_input_files(self):
+        """Collect the CSV files to load, grouped by source"""
         # Default file paths
         default_files = {
             'hevy': 'workout_hevy.csv',
@@ -74,91 +114,197 @@ class DataProcessor:
             'jefit': 'workout_log_jeefit.csv'
         }
         
-        # Lists to hold dataframes from each source
-        hevy_dfs = []
-        strong_dfs = []
-        jefit_dfs = []
-        
-        # Load default files if they exist
-        if os.path.exists(default_files['hevy']):
-            hevy_dfs.append(pd.read_csv(default_files['hevy']))
-        if os.path.exists(default_files['strong']):
-            strong_dfs.append(pd.read_csv(default_files['strong']))
-        if os.path.exists(default_files['jefit']):
-            jefit_dfs.append(pd.read_csv(default_files['jefit']))
-        
-        # Load any uploaded files
-        if os.path.exists(self.uploads_dir):
-            for filename in os.listdir(self.uploads_dir):
-                file_path = os.path.join(self.uploads_dir, filename)
-                if filename.startswith('hevy_'):
-                    hevy_dfs.append(pd.read_csv(file_path))
-                elif filename.startswith('strong_'):
-                    strong_dfs.append(pd.read_csv(file_path))
-                elif filename.startswith('jefit_'):
-                    jefit_dfs.append(pd.read_csv(file_path))
-        
-        # Combine files from the same source
-        hevy_df = pd.concat(hevy_dfs) if hevy_dfs else pd.DataFrame()
-        strong_df = pd.concat(strong_dfs) if strong_dfs else pd.DataFrame()
-        jefit_df = pd.concat(jefit_dfs) if jefit_dfs else pd.DataFrame()
-        
-        # Process only if we have data
-        if not hevy_df.empty:
-            # Standardize Hevy data
-            hevy_df['date'] = pd.to_datetime(hevy_df['start_time'], format='%d %b %Y, %H:%M')
-            hevy_df['exercise'] = hevy_df['exercise_title'].apply(standardize_exercise_name)
-            hevy_df['weight'] = hevy_df['weight_kg']
-            hevy_df['set_number'] = hevy_df['set_index'] + 1
-            hevy_df['source'] = 'Hevy'
+        input_files = {source: [] for source in default_files}
         
-        if not strong_df.empty:
+        # Use default files if they exist
+        for source, file_path in default_files.items():
+            if os.path.exists(file_path):
+                input_files[source].append(file_path)
+        
+        # Add any uploaded files (saved as <source>_<timestamp>.<ext>)
+        for source in input_files:
+            input_files[source].extend(sorted(glob.glob(os.path.join(self.uploads_dir, f"{source}_*"))))
+                    
+        return input_files
+    
+    def get_input_version(self):
+        """Get a key that changes whenever an input file is added or modified"""
+        return self._get_cache_key(self.get_input_files())
+    
+    def _get_cache_key(self, input_files):
+        """Build a cache key from the path, modification time and size of every input file"""
+        file_stats = sorted(
+            (source, file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+            for source, file_paths in input_files.items()
+            for file_path in file_paths
+        )
+        return hashlib.sha1(repr((self.cache_version, file_stats)).encode()).hexdigest()
+    
+    def _get_cache_path(self, cache_key, name):
+        """Get the Parquet cache path for one of the loaded dataframes"""
+        return os.path.join(self.data_dir, f"cache_{cache_key}_{name}.parquet")
+    
+    def _read_cache(self, cache_key):
+        """Read cached dataframes for the given key, or None if they are not available"""
+        cache_paths = [self._get_cache_path(cache_key, name) for name in self.cache_names]
+        if not all(os.path.exists(path) for path in cache_paths):
+            return None
+        try:
+            return tuple(pd.read_parquet(path) for path in cache_paths)
+        except Exception:
+            return None
+    
+    def _write_cache(self, cache_key, dfs):
+        """Write dataframes to the Parquet cache and remove caches for older inputs"""
+        for filename in os.listdir(self.data_dir):
+            if filename.startswith('cache_') and filename.endswith('.parquet'):
+                os.remove(os.path.join(self.data_dir, filename))
+        try:
+            for name, df in zip(self.cache_names, dfs):
+                df.to_parquet(self._get_cache_path(cache_key, name), compression='zstd')
+        except Exception:
+            # Caching is best effort; data that can't be stored is simply reloaded next time
+            for name in self.cache_names:
+                cache_path = self._get_cache_path(cache_key, name)
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+
+    def load_data(self):
+        """Load and process data from CSV files, reusing the Parquet cache when inputs are unchanged"""
+        input_files = self.get_input_files()
+        cache_key = self._get_cache_key(input_files)
+        
+        dfs = self._read_cache(cache_key)
+        if dfs is None:
+            dfs = self._process_data(input_files)
+            self._write_cache(cache_key, dfs)
+        
+        # Tag the combined data with its input version so cached results can be keyed on it
+        dfs[0].attrs['version'] = cache_key
+        return dfs
+
+    def _read_source_files(self, source, file_paths):
+        """Read and standardize every file for a source into one dataframe"""
+        if not file_paths:
+            return pd.DataFrame()
+        
+        return self._concat_sets([self._read_csv(source, file_path) for file_path in file_paths])
+    
+    def _read_csv(self, source, file_path):
+        """Read the needed columns of a single source file and standardize them"""
+        usecols = self.source_columns[source]
+        string_columns = self.source_string_columns[source] + [self.source_date_columns[source][0]]
+        dtype = {column: 'string[pyarrow]' for column in string_columns}
+        
+        # The pyarrow engine loads the whole file at once, so very large exports are streamed in batches;
+        # each batch is standardized and downcast before the next is read so raw rows never pile up
+        if os.path.getsize(file_path) > self.large_file_bytes:
+            batches = pd.read_csv(file_path, usecols=usecols, dtype=dtype, chunksize=self.csv_batch_rows)
+            return self._concat_sets([self._standardize_source(source, batch) for batch in batches])
+        
+        df = pd.read_csv(file_path, usecols=usecols, dtype=dtype, engine='pyarrow')
+        return self._standardize_source(source, df)
+    
+    def _parse_dates(self, source, df):
+        """Parse the date column of a source, turning blank or malformed dates into NaT"""
+        date_column, date_format = self.source_date_columns[source]
+        dates = pd.to_datetime(df[date_column], format=date_format, errors='coerce', cache=True)
+        return dates.astype('datetime64[ns]')
+    
+    def _standardize_source(self, source, df):
+        """Convert raw rows of a source to the common set columns with compact dtypes"""
+        date = self._parse_dates(source, df)
+        
+        if source == 'hevy':
+            # Standardize Hevy data
+            sets = pd.DataFrame({
+                'date': date,
+                'exercise': standardize_exercise_series(df['exercise_title']),
+                'weight': df['weight_kg'],
+                'reps': df['reps'],
+                'set_number': df['set_index'] + 1
+            })
+        elif source == 'strong':
             # Standardize Strong data
-            strong_df['date'] = pd.to_datetime(strong_df['Date'])
-            strong_df['exercise'] = strong_df['Exercise Name'].apply(standardize_exercise_name)
-            strong_df['weight'] = strong_df['Weight']
-            strong_df['reps'] = strong_df['Reps']
-            strong_df['set_number'] = strong_df['Set Order']
-            strong_df['source'] = 'Strong'
-        
-        if not jefit_df.empty:
-            # Process Jefit data
-            jefit_df['date'] = pd.to_datetime(jefit_df['mydate'])
-            jefit_df['exercise'] = jefit_df['ename'].apply(standardize_exercise_name)
-            jefit_df['source'] = 'Jefit'
-            
-            # Expand Jefit sets into separate rows
-            jefit_expanded = []
-            for _, row in jefit_df.iterrows():
-                sets = row['logs'].split(',')
-                for i, set_info in enumerate(sets):
-                    if set_info.strip():
-                        weight, reps = map(float, set_info.split('x'))
-                        jefit_expanded.append(
-                            {'date': row['date'], 'exercise': row['exercise'], 'weight': weight, 'reps': reps,
-                                'set_number': i + 1, 'source': 'Jefit'})
-            
-            jefit_df = pd.DataFrame(jefit_expanded) if jefit_expanded else pd.DataFrame()
+            sets = pd.DataFrame({
+                'date': date,
+                'exercise': standardize_exercise_series(df['Exercise Name']),
+                'weight': df['Weight'],
+                'reps': df['Reps'],
+                'set_number': df['Set Order']
+            })
+        else:
+            # Expand Jefit sets into separate rows ("60x10,65x10" -> one row per set)
+            df = df.assign(date=date).reset_index(drop=True)
+            logs = df['logs'].str.split(',').explode().str.strip()
+            set_numbers = logs.groupby(level=0).cumcount() + 1
+
+            # Split each entry into weight and reps; anything that isn't a single "weight x reps" pair
+            # (such as "60x10x2") is left without numbers
+            parts = logs.str.split('x', n=1, expand=True).reindex(columns=[0, 1])
+            weight = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            reps = pd.to_numeric(parts[1], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+            # Drop empty and malformed entries but keep the original set positions
+            valid_sets = ~(np.isnan(weight) | np.isnan(reps))
+            positions = logs.index[valid_sets]
+            sets = pd.DataFrame({
+                'date': df['date'].to_numpy()[positions],
+                'exercise': standardize_exercise_series(df['ename']).to_numpy()[positions],
+                'weight': weight[valid_sets],
+                'reps': reps[valid_sets],
+                'set_number': set_numbers.to_numpy()[valid_sets]
+            })
         
-        # Select common columns and combine all datasets
-        common_columns = ['date', 'exercise', 'weight', 'reps', 'set_number', 'source']
-        dfs_to_combine = []
+        # Sets without a usable date or exercise name can't be placed on any chart or selected, so drop them
+        sets = sets[sets['date'].notna() & sets['exercise'].notna()]
         
-        if not hevy_df.empty:
-            dfs_to_combine.append(hevy_df[common_columns])
-        if not strong_df.empty:
-            dfs_to_combine.append(strong_df[common_columns])
-        if not jefit_df.empty:
-            dfs_to_combine.append(jefit_df[common_columns])
+        # Gym loads don't need 64-bit precision; smaller dtypes halve memory traffic in the analyzers
+        # (set numbers are nullable because exports can leave the set order blank)
+        sets = sets.astype({'exercise': 'category', 'weight': 'float32', 'reps': 'float32', 'set_number': 'Int16'})
+        sets['source'] = pd.Categorical([source.capitalize()] * len(sets), categories=self.source_names)
+        return sets.reset_index(drop=True)
+    
+    @staticmethod
+    def _concat_sets(frames):
+        """Concatenate standardized set frames, keeping `exercise` categorical across differing categories"""
+        categories = frames[0]['exercise'].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame['exercise'].cat.categories)
+        frames = [frame.assign(exercise=frame['exercise'].cat.set_categories(categories)) for frame in frames]
+        return pd.concat(frames, ignore_index=True)
+
+    def _process_data(self, input_files):
+        """Read and standardize the input CSV files from every source"""
+        # Read and standardize files from the same source, reading the sources concurrently
+        # (the pyarrow CSV reader releases the GIL while parsing)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self._read_source_files, source, input_files[source])
+                       for source in ('hevy', 'strong', 'jefit')]
+            hevy_df, strong_df, jefit_df = [future.result() for future in futures]
         
         # Combine all datasets
-        combined_df = pd.concat(dfs_to_combine, ignore_index=True) if dfs_to_combine else pd.DataFrame(columns=common_columns)
+        dfs_to_combine = [df for df in (hevy_df, strong_df, jefit_df) if not df.empty]
+        common_columns = ['date', 'exercise', 'weight', 'reps', 'set_number', 'source']
+        combined_df = self._concat_sets(dfs_to_combine) if dfs_to_combine else pd.DataFrame(columns=common_columns)
         
         if not combined_df.empty:
+            # Sort by date before adding derived columns so the sort copies as little as possible
+            order = np.argsort(combined_df['date'].to_numpy().view('int64'), kind='stable')
+            combined_df = combined_df.iloc[order].reset_index(drop=True)
+            
             # Calculate 1RM for each set
-            combined_df['one_rm'] = combined_df.apply(lambda x: calculate_1rm(x['weight'], x['reps']), axis=1)
+            combined_df['one_rm'] = calculate_1rm_vec(combined_df['weight'].to_numpy(),
+                                                      combined_df['reps'].to_numpy()).astype('float32')
+            
+            # Calculate volume (weight x reps) for each set
+            combined_df['volume'] = combined_df['weight'].to_numpy() * combined_df['reps'].to_numpy()
+            
+            # Precompute month and week grouping keys for the frequency charts
+            combined_df['month_code'] = get_month_codes(combined_df['date'])
+            combined_df['week_code'] = get_week_codes(combined_df['date'])
             
-            # Sort by date
-            combined_df = combined_df.sort_values('date')
+            # Year of each set for the year filters, derived from the month code instead of another dt pass
+            combined_df['year'] = (combined_df['month_code'] // 12).astype('int16')
         
         return combined_df, hevy_df, strong_df, jefit_df
@@ -1,6 +1,8 @@
 #######################
 # Workout Analysis
 #######################
+import numpy as np
+
 
 class WorkoutAnalyzer:
     """Class for analyzing workout data"""
@@ -15,7 +17,14 @@ class WorkoutAnalyzer:
     
     def get_top_sets(self, df, exercise, limit=10):
         """Get top sets for a specific exercise"""
-        top_sets = df[df['exercise'] == exercise].nlargest(limit, 'one_rm')
+        exercise_sets = df[df['exercise'] == exercise].dropna(subset=['one_rm'])
+        one_rm = exercise_sets['one_rm'].to_numpy()
+        
+        # Partition out the top sets instead of sorting every set of the exercise
+        if len(one_rm) > limit:
+            top_idx = np.argpartition(-one_rm, limit)[:limit]
+            exercise_sets = exercise_sets.iloc[top_idx]
+        top_sets = exercise_sets.sort_values('one_rm', ascending=False)
         top_sets['date'] = top_sets['date'].dt.strftime('%Y-%m-%d')
         top_sets_display = top_sets[['date', 'weight', 'reps', 'one_rm', 'source']].copy()
         top_sets_display.columns = ['Date', 'Weight (kg)', 'Reps', '1RM (kg)', 'App']
@@ -24,7 +33,7 @@ class WorkoutAnalyzer:
     
     def get_exercise_details(self, df):
         """Get detailed exercise statistics"""
-        exercise_details = df.groupby('exercise').agg({
+        exercise_details = df.groupby('exercise', observed=True).agg({
             'weight': ['max', 'mean'],
             'reps': ['max', 'mean'],
             'one_rm': ['max', 'mean'],
@@ -38,9 +47,9 @@ class WorkoutAnalyzer:
     
     def get_app_comparison(self, df):
         """Get app comparison statistics"""
-        app_stats = df.groupby('source').agg({
+        app_stats = df.groupby('source', observed=True).agg({
             'exercise': 'count',
-            'weight': lambda x: (x * df.loc[x.index, 'reps']).sum(),
+            'volume': 'sum',
             'one_rm': 'max',
             'date': 'nunique'
         }).reset_index()
@@ -0,0 +1,125 @@
+import pandas as pd
+import pytest
+
+from models.data_processor import DataProcessor
+
+
+STRONG_HEADER = 'Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Distance,Seconds,Notes,Workout Notes,RPE\n'
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """DataProcessor working in an empty temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return DataProcessor()
+
+
+def write_strong_csv(tmp_path, rows):
+    """Write a Strong export with the given data rows and return its path"""
+    file_path = tmp_path / 'strong.csv'
+    file_path.write_text(STRONG_HEADER + ''.join(row + '\n' for row in rows))
+    return str(file_path)
+
+
+def process_strong(processor, file_path):
+    """Process a single Strong export and return the combined dataframe"""
+    return processor._process_data({'hevy': [], 'strong': [file_path], 'jefit': []})[0]
+
+
+def test_blank_set_order_is_loaded(processor, tmp_path):
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",,57.0,11,0,0,,,',
+    ])
+
+    combined_df = process_strong(processor, file_path)
+
+    assert len(combined_df) == 2
+    assert combined_df['set_number'].iloc[0] == 1
+    assert pd.isna(combined_df['set_number'].iloc[1])
+
+
+def test_blank_date_row_is_dropped(processor, tmp_path):
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        ',"Upper",47m,"Chest Press (Machine)",2,57.0,11,0,0,,,',
+    ])
+
+    combined_df = process_strong(processor, file_path)
+
+    assert len(combined_df) == 1
+    assert combined_df['date'].notna().all()
+    assert combined_df['year'].tolist() == [2024]
+
+
+def test_malformed_date_row_is_dropped(processor, tmp_path):
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        'not a date,"Upper",47m,"Chest Press (Machine)",2,57.0,11,0,0,,,',
+        '2024-01-28 10:00:00,"Upper",47m,"Chest Press (Machine)",1,30.0,10,0,0,,,',
+    ])
+
+    combined_df = process_strong(processor, file_path)
+
+    assert combined_df['date'].tolist() == [pd.Timestamp('2024-01-26 18:52:38'), pd.Timestamp('2024-01-28 10:00:00')]
+
+
+def test_malformed_date_row_is_dropped_in_batched_read(processor, tmp_path):
+    processor.large_file_bytes = 0
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        'not a date,"Upper",47m,"Chest Press (Machine)",2,57.0,11,0,0,,,',
+    ])
+
+    combined_df = process_strong(processor, file_path)
+
+    assert combined_df['date'].tolist() == [pd.Timestamp('2024-01-26 18:52:38')]
+
+
+def test_batches_are_standardized_before_concatenating(processor, tmp_path, monkeypatch):
+    processor.large_file_bytes = 0
+    processor.csv_batch_rows = 1
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        '2024-01-27 18:52:38,"Upper",47m,"Bench Press (Barbell)",1,57.0,11,0,0,,,',
+    ])
+    concatenated = []
+    concat_sets = DataProcessor._concat_sets
+    monkeypatch.setattr(DataProcessor, '_concat_sets',
+                        staticmethod(lambda frames: concatenated.append(frames) or concat_sets(frames)))
+
+    processor._read_csv('strong', file_path)
+
+    batches, = concatenated
+    assert len(batches) == 2
+    for batch in batches:
+        assert list(batch.columns) == ['date', 'exercise', 'weight', 'reps', 'set_number', 'source']
+        assert batch['date'].dtype == 'datetime64[ns]'
+        assert batch['exercise'].dtype == 'category'
+        assert batch['weight'].dtype == 'float32'
+        assert batch['set_number'].dtype == 'Int16'
+    assert [batch['exercise'].iloc[0] for batch in batches] == ['chest press (machine)', 'Barbell Bench Press']
+
+
+def test_malformed_jefit_set_is_skipped(processor, tmp_path):
+    file_path = tmp_path / 'jefit.csv'
+    file_path.write_text('mydate,ename,logs\n'
+                         '2022-05-04,"Wide Grip Lat Pulldown","60x10,65x10x2,,70x8"\n')
+
+    combined_df = processor._process_data({'hevy': [], 'strong': [], 'jefit': [str(file_path)]})[0]
+
+    assert combined_df['weight'].tolist() == [60.0, 70.0]
+    assert combined_df['reps'].tolist() == [10.0, 8.0]
+    assert combined_df['set_number'].tolist() == [1, 4]
+
+
+def test_blank_exercise_name_row_is_dropped(processor, tmp_path):
+    file_path = write_strong_csv(tmp_path, [
+        '2024-01-26 18:52:38,"Upper",47m,"Chest Press (Machine)",1,29.0,10,0,0,,,',
+        '2024-01-26 18:52:38,"Upper",47m,,2,57.0,11,0,0,,,',
+    ])
+
+    combined_df = process_strong(processor, file_path)
+
+    assert combined_df['exercise'].tolist() == ['chest press (machine)']
+    assert sorted(combined_df['exercise'].unique()) == ['chest press (machine)']
@@ -1,13 +1,44 @@
 #######################
 # Utility Functions
 #######################
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
 
 def calculate_1rm(weight, reps):
     """Calculate 1RM using Epley Formula"""
     return weight * (1 + reps/30)
 
-def standardize_exercise_name(exercise):
-    """Standardize exercise names for consistency"""
+def calculate_1rm_vec(weight, reps):
+    """Calculate 1RM using Epley Formula for whole arrays of sets at once"""
+    weight = np.asarray(weight, dtype='float64')
+    reps = np.asarray(reps, dtype='float64')
+    return weight * (1.0 + reps * (1.0/30.0))
+
+def get_month_codes(dates):
+    """Get integer month codes (year * 12 + month - 1) for a datetime Series"""
+    return (dates.dt.year * 12 + dates.dt.month - 1).astype('int32')
+
+def get_week_codes(dates):
+    """Get integer codes for Monday-based weeks, counted from the week of 1970-01-01"""
+    days = dates.to_numpy(dtype='datetime64[D]').astype('int64')
+    # 1970-01-01 was a Thursday, so shift by 3 days to make weeks start on Monday
+    return pd.Series((days + 3) // 7, index=dates.index, dtype='int32')
+
+def get_month_labels(month_codes):
+    """Convert month codes back to 'YYYY-MM' labels"""
+    return [f"{code // 12}-{code % 12 + 1:02d}" for code in month_codes]
+
+def get_week_labels(week_codes):
+    """Convert week codes back to 'YYYY-MM-DD' labels of the Monday starting each week"""
+    week_starts = (np.asarray(week_codes, dtype='int64') * 7 - 3).astype('datetime64[D]')
+    return np.datetime_as_string(week_starts, unit='D').tolist()
+
+@lru_cache(maxsize=4096)
+def _standardize_exercise_name(exercise):
+    """Cached implementation of standardize_exercise_name for hashable names"""
     exercise = exercise.lower()
     if 'lat pulldown' in exercise:
         return 'Lat Pulldown (All Variations)'
@@ -17,4 +48,46 @@ def standardize_exercise_name(exercise):
         return 'Dumbbell Bench Press'
     return exercise
 
+def standardize_exercise_name(exercise):
+    """Standardize exercise names for consistency"""
+    return _standardize_exercise_name(str(exercise))
+
+def standardize_exercise_series(exercises):
+    """Standardize a whole column of exercise names in one vectorized pass"""
+    exercises = exercises.str.lower()
+
+    def contains(pattern):
+        return exercises.str.contains(pattern, regex=False, na=False).to_numpy(dtype=bool)
+
+    is_lat_pulldown = contains('lat pulldown')
+    is_barbell_bench = contains('barbell bench press') | contains('bench press (barbell)')
+    is_dumbbell_bench = contains('dumbbell bench press') | contains('bench press (dumbbell)')
+    standardized = np.select(
+        [is_lat_pulldown, is_barbell_bench, is_dumbbell_bench],
+        ['Lat Pulldown (All Variations)', 'Barbell Bench Press', 'Dumbbell Bench Press'],
+        default=exercises.to_numpy(dtype=object)
+    )
+    return pd.Series(standardized, index=exercises.index, dtype=object)
+
+def calculate_workout_streaks(workout_days, today):
+    """Get the current and longest runs of consecutive workout days
+
+    Args:
+        workout_days: Sorted array of unique workout days (datetime64[D])
+        today: Date the current streak has to end on; it is 0 when there was no workout today
+    """
+    if len(workout_days) == 0:
+        return 0, 0
+
+    # A new run starts wherever the gap to the previous workout day is not exactly one day
+    run_starts = np.flatnonzero(np.diff(workout_days).astype('int64') != 1) + 1
+    run_lengths = np.diff(np.concatenate(([0], run_starts, [len(workout_days)])))
+    max_streak = int(run_lengths.max())
+
+    today_idx = np.searchsorted(workout_days, np.datetime64(today, 'D'))
+    if today_idx == len(workout_days) or workout_days[today_idx] != np.datetime64(today, 'D'):
+        return 0, max_streak
 
+    # Count the days from the start of today's run up to today
+    run_start = np.concatenate(([0], run_starts))[np.searchsorted(run_starts, today_idx, side='right')]
+    return int(today_idx - run_start + 1), max_streak
@@ -3,50 +3,31 @@
 #######################
 from datetime import datetime, timedelta
 
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Define GitHub-style colors
+CALENDAR_COLORS = ['#ebedf0',  # 0 contributions
+                   '#9be9a8',  # 1-2 contributions
+                   '#40c463',  # 3-4 contributions
+                   '#30a14e',  # 5-6 contributions
+                   '#216e39']  # 7+ contributions
+CALENDAR_LABELS = ['No workouts', '1-2 workouts', '3-4 workouts', '5-6 workouts', '7+ workouts']
 
 
 class CalendarVisualizer:
     """Class for creating calendar visualizations"""
 
-    def create_calendar_heatmap(self, workout_dates, year=None):
-        """Create a GitHub-style calendar heatmap"""
-        if year is None:
-            year = datetime.now().year
-            
-        # Check if workout_dates is empty
-        if len(workout_dates) == 0:
-            # Create a figure with a message when no data is available
-            fig, ax = plt.subplots(figsize=(20, 8))
-            ax.text(0.5, 0.5, "No workout data available for the selected filters", 
-                   horizontalalignment='center', verticalalignment='center', 
-                   transform=ax.transAxes, fontsize=14)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            return fig
+    @staticmethod
+    def _get_calendar_grid(workout_dates, year):
+        """Lay out a year as weeks of days (Sunday to Saturday) with workout counts and color buckets
 
-        # Create a dictionary to store workout counts per day
-        workout_counts = {}
-        for date in workout_dates:
-            date = date.date()
-            if date.year == year:
-                if date in workout_counts:
-                    workout_counts[date] += 1
-                else:
-                    workout_counts[date] = 1
-
-        # Create a figure and axis with a larger figure size and better spacing
-        fig, ax = plt.subplots(figsize=(20, 8))
-        plt.subplots_adjust(left=0.05, right=0.95, top=0.90, bottom=0.1)
-
-        # Define GitHub-style colors
-        colors = ['#ebedf0',  # 0 contributions
-                  '#9be9a8',  # 1-2 contributions
-                  '#40c463',  # 3-4 contributions
-                  '#30a14e',  # 5-6 contributions
-                  '#216e39']  # 7+ contributions
+        Returns the grid dates, the number of weeks, and the per-day counts and buckets as (7, weeks) arrays.
+        """
+        # Count workouts per day for the selected year
+        dates = pd.to_datetime(pd.Series(workout_dates))
+        workout_counts = dates[dates.dt.year == year].dt.normalize().value_counts()
 
         # Get all dates for the year
         start_date = datetime(year, 1, 1).date()
@@ -60,70 +41,75 @@ class CalendarVisualizer:
         while end_date.weekday() != 5:  # 5 is Saturday
             end_date += timedelta(days=1)
 
-        # Create calendar grid
-        current_date = start_date
-        week_num = 0
-
-        while current_date <= end_date:
-            for day_num in range(7):  # 0 = Sunday, 6 = Saturday
-                date = current_date + timedelta(days=day_num)
-
-                # Get workout count for the day
-                count = workout_counts.get(date, 0)
-
-                # Determine color based on count
-                if count == 0:
-                    color = colors[0]
-                elif count <= 2:
-                    color = colors[1]
-                elif count <= 4:
-                    color = colors[2]
-                elif count <= 6:
-                    color = colors[3]
-                else:
-                    color = colors[4]
-
-                # Add rectangle for the day
-                rect = plt.Rectangle((week_num, 6 - day_num),  # Flip y-axis to match GitHub (Monday at top)
-                    0.9,  # Width slightly less than 1 for spacing
-                    0.9,  # Height slightly less than 1 for spacing
-                    facecolor=color, edgecolor='white', linewidth=1)
-                ax.add_patch(rect)
-
-                # Add month label at the top of the first full week of each month
-                if date.day <= 7 and day_num == 6:  # Saturday of first week
-                    ax.text(week_num, 7.5, date.strftime('%b'), ha='center', va='bottom', fontsize=10,
-                            fontweight='bold', color='#666666')
-
-            current_date += timedelta(days=7)
-            week_num += 1
-
-        # Add weekday labels on the left
-        weekdays = ['Mon', 'Wed', 'Fri']
-        weekday_positions = [5, 3, 1]  # Corresponding to Monday, Wednesday, Friday
-        for day, pos in zip(weekdays, weekday_positions):
-            ax.text(-0.5, pos, day, ha='right', va='center', fontsize=10, color='#666666')
-
-        # Set the axis limits with padding
-        ax.set_xlim(-1, week_num + 1)
-        ax.set_ylim(-1, 8)  # Extra space for month labels
-
-        # Remove axis lines and ticks
-        ax.set_xticks([])
-        ax.set_yticks([])
-        for spine in ax.spines.values():
-            spine.set_visible(False)
-
-        # Add title
-        plt.suptitle(f'Workout Contribution Calendar {year}', y=0.95, fontsize=14, fontweight='bold')
-
-        # Add legend
-        legend_elements = [plt.Rectangle((0, 0), 1, 1, facecolor=colors[0], label='No workouts'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors[1], label='1-2 workouts'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors[2], label='3-4 workouts'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors[3], label='5-6 workouts'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors[4], label='7+ workouts')]
-        ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.0, -0.1), ncol=5, frameon=False,
-                  fontsize=10)
+        # Create calendar grid: one column per week (Sunday to Saturday), one row per day
+        grid_dates = pd.date_range(start_date, end_date, freq='D')
+        week_num = len(grid_dates) // 7
+        counts = workout_counts.reindex(grid_dates, fill_value=0).to_numpy().reshape(week_num, 7).T
+
+        # Determine color bucket based on count (0, 1-2, 3-4, 5-6, 7+)
+        buckets = np.digitize(counts, [1, 3, 5, 7])
+        return grid_dates, week_num, counts, buckets
+
+    def create_calendar_heatmap_plotly(self, workout_dates, year=None):
+        """Create a GitHub-style calendar heatmap as an interactive Plotly figure"""
+        if year is None:
+            year = datetime.now().year
+
+        # Check if workout_dates is empty
+        if len(workout_dates) == 0:
+            # Create an empty Plotly figure with a message
+            fig = go.Figure()
+            fig.add_annotation(
+                text="No workout data available for the selected filters",
+                xref="paper", yref="paper",
+                x=0.5, y=0.5,
+                showarrow=False,
+                font=dict(size=14)
+            )
+            fig.update_layout(
+                height=300,
+                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+            )
+            return fig
+
+        grid_dates, week_num, counts, buckets = self._get_calendar_grid(workout_dates, year)
+
+        # Create hover texts for every day of the grid
+        day_strs = grid_dates.strftime('%a %b %d, %Y').to_numpy().reshape(week_num, 7).T
+        hover_texts = [[f"{day_str}<br>{count} workout{'s' if count != 1 else ''}"
+                        for day_str, count in zip(day_row, count_row)]
+                       for day_row, count_row in zip(day_strs, counts)]
+
+        # Map each bucket to its own color band
+        colorscale = []
+        for level, color in enumerate(CALENDAR_COLORS):
+            colorscale += [[level / len(CALENDAR_COLORS), color], [(level + 1) / len(CALENDAR_COLORS), color]]
+
+        # Draw all days as a single heatmap, one row per weekday with Sunday at the top
+        fig = go.Figure()
+        fig.add_trace(
+            go.Heatmap(z=buckets, x=np.arange(week_num), y=np.arange(7), zmin=0, zmax=len(CALENDAR_COLORS) - 1,
+                colorscale=colorscale, showscale=False, xgap=3, ygap=3,  # White gaps between days
+                customdata=hover_texts, hovertemplate='%{customdata}<extra></extra>'))
+
+        # Add month label above the first full week of each month
+        saturdays = grid_dates[6::7]
+        month_weeks = np.flatnonzero(saturdays.day <= 7)
+
+        fig.update_layout(title=f'Workout Contribution Calendar {year}', plot_bgcolor='white', paper_bgcolor='white',
+            height=300, margin=dict(l=50, r=50, t=80, b=30),
+            xaxis=dict(showgrid=False, zeroline=False, side='top', tickmode='array', tickvals=month_weeks,
+                ticktext=saturdays[month_weeks].strftime('%b').tolist(), tickangle=0),
+            yaxis=dict(showgrid=False, zeroline=False, tickmode='array', tickvals=[1, 3, 5],
+                ticktext=['Mon', 'Wed', 'Fri'], autorange='reversed',
+                scaleanchor='x', scaleratio=1, constrain='domain'),  # Keep the days square
+            legend=dict(orientation='h', yanchor='top', y=-0.05, xanchor='right', x=1))
+
+        # Add legend as separate traces
+        for color, label in zip(CALENDAR_COLORS, CALENDAR_LABELS):
+            fig.add_trace(
+                go.Scatter(x=[None], y=[None], mode='markers', marker=dict(size=10, color=color, symbol='square'),
+                    name=label, showlegend=True))
 
         return fig
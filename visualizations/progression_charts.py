@@ -2,15 +2,18 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 
+from utils.calculations import get_month_codes, get_month_labels, get_week_codes, get_week_labels
+
 
 class ProgressionVisualizer:
     """Class for creating progression and frequency visualizations"""
 
     def create_monthly_frequency_chart(self, df):
         """Create monthly workout frequency chart"""
-        df['month_year'] = df['date'].dt.to_period('M')
-        monthly_workouts = df.groupby('month_year')['date'].nunique().reset_index()
-        monthly_workouts['month_year'] = monthly_workouts['month_year'].astype(str)
+        # Group on a local key Series so the caller's frame is never modified
+        month_codes = df['month_code'] if 'month_code' in df.columns else get_month_codes(df['date'])
+        monthly_workouts = df.groupby(month_codes.rename('month_code'))['date'].nunique().reset_index()
+        monthly_workouts['month_year'] = get_month_labels(monthly_workouts['month_code'])
 
         fig = px.line(monthly_workouts, x='month_year', y='date', title='Monthly Workout Frequency',
                       labels={'date': 'Number of Workouts', 'month_year': 'Month'})
@@ -19,8 +22,9 @@ class ProgressionVisualizer:
 
     def create_weekly_frequency_chart(self, df):
         """Create weekly workout frequency chart"""
-        df['week_start'] = df['date'].dt.to_period('W').astype(str).str.split('/').str[0]
-        weekly_workouts = df.groupby('week_start')['date'].nunique().reset_index()
+        week_codes = df['week_code'] if 'week_code' in df.columns else get_week_codes(df['date'])
+        weekly_workouts = df.groupby(week_codes.rename('week_code'))['date'].nunique().reset_index()
+        weekly_workouts['week_start'] = get_week_labels(weekly_workouts['week_code'])
 
         fig = px.bar(weekly_workouts, x='week_start', y='date', title='Weekly Workout Frequency',
                      labels={'date': 'Number of Workouts', 'week_start': 'Week Starting'})
@@ -29,7 +33,8 @@ class ProgressionVisualizer:
 
     def create_exercise_distribution_chart(self, df):
         """Create exercise distribution chart"""
-        exercise_counts = df['exercise'].value_counts().head(10)
+        exercise_counts = df['exercise'].value_counts()
+        exercise_counts = exercise_counts[exercise_counts > 0].head(10)
         chart_df = pd.DataFrame({
             'Exercise': exercise_counts.index,
             'Count': exercise_counts.values
@@ -62,9 +67,8 @@ class ProgressionVisualizer:
 
     def create_volume_chart(self, df):
         """Create volume analysis chart"""
-        volume_data = df.groupby('date').agg(
-            {'weight': lambda x: (x * df.loc[x.index, 'reps']).sum(), 'exercise': 'count'}).reset_index()
+        volume_data = df.groupby('date').agg({'volume': 'sum', 'exercise': 'count'}).reset_index()
 
-        fig = px.scatter(volume_data, x='date', y='weight', size='exercise', title='Daily Volume (Weight × Reps)',
-                         labels={'weight': 'Total Volume (kg)', 'exercise': 'Number of Exercises'})
+        fig = px.scatter(volume_data, x='date', y='volume', size='exercise', title='Daily Volume (Weight × Reps)',
+                         labels={'volume': 'Total Volume (kg)', 'exercise': 'Number of Exercises'})
         return fig
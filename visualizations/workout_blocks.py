@@ -1,13 +1,44 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
 import plotly.graph_objects as go
 
+# Short month names indexed by month - 1, used instead of a per-date strftime('%b')
+_MONTH_ABBR = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
 
 class WorkoutBlocksVisualizer:
     """Class for creating workout block visualizations"""
 
-    def create_weekly_blocks(self, workout_data, min_sessions=3):
-        """Create weekly blocks visualization"""
+    # Above this many weeks the per-week labels are skipped; the blocks alone are drawn much faster
+    max_labeled_weeks = 120
+
+    # Above this many weeks a compact one-row-per-year layout is drawn instead of the large blocks
+    max_block_weeks = 150
+
+    @staticmethod
+    def get_weekly_sessions(workout_data):
+        """Count workout sessions per ISO (year, week), without modifying workout_data"""
+        iso_dates = workout_data['date'].dt.isocalendar()
+        sessions = workout_data['date'].groupby([iso_dates['year'], iso_dates['week']]).nunique()
+        return sessions.rename('sessions').reset_index()
+
+    @staticmethod
+    def _get_week_sessions(complete_weeks, weekly_sessions):
+        """Look up the session count of every (year, week) row, using 0 for weeks without workouts"""
+        weekly_map = weekly_sessions.set_index(['year', 'week'])['sessions']
+        week_keys = pd.MultiIndex.from_arrays([complete_weeks['year'], complete_weeks['week']])
+        return weekly_map.reindex(week_keys).fillna(0).to_numpy()
+
+    def create_weekly_blocks(self, workout_data, min_sessions=3, weekly_sessions=None):
+        """Create weekly blocks visualization
+
+        Args:
+            workout_data: DataFrame of workout sets
+            min_sessions: Sessions per week needed for a green block
+            weekly_sessions: Optional precomputed result of get_weekly_sessions(workout_data)
+        """
         # Check if workout_data is empty
         if workout_data.empty:
             # Create a figure with a message when no data is available
@@ -27,24 +58,26 @@ class WorkoutBlocksVisualizer:
 
         # Create a complete date range with all weeks
         date_range = pd.date_range(start=min_date, end=max_date, freq='W')
+        months = date_range.month.to_numpy()
         complete_weeks = pd.DataFrame(
-            {'date': date_range, 'year': date_range.year, 'week': date_range.isocalendar().week,
-                'month': date_range.month, 'month_name': date_range.strftime('%b')  # Short month name
+            {'date': date_range, 'year': date_range.year, 'week': date_range.isocalendar().week.to_numpy(),
+                'month': months, 'month_name': _MONTH_ABBR[months - 1]  # Short month name
             })
 
         # Count sessions per week in actual data
-        workout_data['week'] = workout_data['date'].dt.isocalendar().week
-        workout_data['year'] = workout_data['date'].dt.isocalendar().year
-        weekly_sessions = workout_data.groupby(['year', 'week'])['date'].nunique().reset_index()
+        if weekly_sessions is None:
+            weekly_sessions = self.get_weekly_sessions(workout_data)
 
-        # Merge complete weeks with actual sessions, filling NaN with 0
-        complete_weeks_sessions = complete_weeks[['year', 'week', 'month', 'month_name']].drop_duplicates().merge(
-            weekly_sessions, on=['year', 'week'], how='left')
-        complete_weeks_sessions['date'] = complete_weeks_sessions['date'].fillna(0)
+        # Add the session count of each week (there is already one row per week, so no merge is needed)
+        complete_weeks_sessions = complete_weeks.assign(sessions=self._get_week_sessions(complete_weeks, weekly_sessions))
 
         # Sort by year and week
         complete_weeks_sessions = complete_weeks_sessions.sort_values(['year', 'week'])
 
+        # Long histories don't fit the labeled blocks, so switch to the compact layout
+        if len(complete_weeks_sessions) > self.max_block_weeks:
+            return self._create_compact_blocks(complete_weeks_sessions, min_sessions)
+
         # Create a figure and axis with larger size
         fig, ax = plt.subplots(figsize=(24, 12))
         plt.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.08)
@@ -56,77 +89,53 @@ class WorkoutBlocksVisualizer:
         total_entries = len(complete_weeks_sessions)
         rows = (total_entries // weeks_per_row) + (1 if total_entries % weeks_per_row else 0)
 
-        # Track the current year and month for drawing separators and labels
-        current_year = None
-        current_month = None
-        month_start_x = None
-
-        # Plot the weeks
-        for idx, row in complete_weeks_sessions.iterrows():
-            # Calculate position
-            row_idx = idx // weeks_per_row
-            col_idx = idx % weeks_per_row
-
-            # Check if year has changed
-            if current_year != row['year']:
-                if current_year is not None:
-                    # Draw a subtle separator line between years
-                    y_pos = (rows - row_idx) * 2
-                    plt.axhline(y=y_pos, color='#666666', linestyle='--', alpha=0.3, linewidth=1)
-                current_year = row['year']
-
-            # Check if month has changed
-            if current_month != row['month']:
-                if month_start_x is not None:
-                    # Add month label for the previous month
-                    month_width = col_idx - month_start_x
-                    if month_width > 0:  # Only add label if there's space
-                        ax.text(month_start_x + month_width / 2, rows * 2 + 0.5, prev_month_name, ha='center',
-                                va='bottom', fontsize=10, fontweight='bold', color='#666666')
-                month_start_x = col_idx
-                current_month = row['month']
-                prev_month_name = row['month_name']
-
-            # Determine color based on session count
-            if row['date'] >= min_sessions:
-                color = '#2ecc71'  # Bright green
-                alpha = 0.8
-            else:
-                color = '#e74c3c'  # Red
-                alpha = 0.6
-
-            # Add block with border
-            rect = plt.Rectangle((col_idx * 1.2, (rows - row_idx - 1) * 2),  # Increased spacing
-                1, 1.5,  # Wider blocks
-                facecolor=color, edgecolor='#333333',  # Dark border
-                alpha=alpha, linewidth=0.5)
-            ax.add_patch(rect)
-
-            # Add week label and count with improved visibility
-            week_label = f"Week {row['week']}"
-            count_label = f"{int(row['date'])} sessions"
-
-            # Add text with better positioning and formatting
-            ax.text(col_idx * 1.2 + 0.5, (rows - row_idx - 1) * 2 + 1.1, week_label, ha='center', va='center',
-                    color='black', fontsize=9, fontweight='bold')
-
-            ax.text(col_idx * 1.2 + 0.5, (rows - row_idx - 1) * 2 + 0.5, count_label, ha='center', va='center',
-                    color='black', fontsize=8)
-
-            # Add year label at the start of each row with background
-            if col_idx == 0:
-                # Add background rectangle for year label
-                year_rect = plt.Rectangle((-1, (rows - row_idx - 1) * 2), 0.8, 1.5, facecolor='#f8f9fa',
-                    edgecolor='#dee2e6', alpha=0.8, linewidth=0.5)
-                ax.add_patch(year_rect)
-
-                ax.text(-0.6, (rows - row_idx - 1) * 2 + 0.75, str(row['year']), ha='center', va='center', fontsize=11,
-                        fontweight='bold', bbox=dict(facecolor='white', edgecolor='none', alpha=0.8, pad=2))
-
-        # Add the last month label
-        if month_start_x is not None:
-            ax.text(month_start_x + (col_idx - month_start_x) / 2, rows * 2 + 0.5, prev_month_name, ha='center',
-                    va='bottom', fontsize=10, fontweight='bold', color='#666666')
+        # Draw all week blocks as one collection; positions follow the row labels
+        block_idx = complete_weeks_sessions.index.to_numpy()
+        block_x = (block_idx % weeks_per_row) * 1.2  # Increased spacing
+        block_y = (rows - block_idx // weeks_per_row - 1) * 2
+        ax.add_collection(self._week_blocks(block_x, block_y, 1, 1.5,  # Wider blocks
+                                            complete_weeks_sessions['sessions'].to_numpy() >= min_sessions))
+
+        # Add background rectangles for the year labels at the start of each row
+        row_starts = block_idx[block_idx % weeks_per_row == 0]
+        row_start_y = (rows - row_starts // weeks_per_row - 1) * 2
+        ax.add_collection(PolyCollection(
+            self._rectangle_vertices(np.full(len(row_starts), -1.0), row_start_y, 0.8, 1.5),
+            facecolors=to_rgba('#f8f9fa', 0.8), edgecolors=to_rgba('#dee2e6', 0.8), linewidths=0.5))
+
+        # Precompute the grid position of every week once, in plotting order
+        row_idxs = block_idx // weeks_per_row
+        col_idxs = block_idx % weeks_per_row
+        years = complete_weeks_sessions['year'].to_numpy()
+        months = complete_weeks_sessions['month'].to_numpy()
+        month_names = complete_weeks_sessions['month_name'].to_numpy()
+
+        # Draw a subtle separator line wherever the year changes
+        for i in np.flatnonzero(np.diff(years) != 0) + 1:
+            plt.axhline(y=(rows - row_idxs[i]) * 2, color='#666666', linestyle='--', alpha=0.3, linewidth=1)
+
+        # Add a month label centered over the columns of each run of weeks in the same month
+        month_starts = np.flatnonzero(np.diff(months, prepend=-1) != 0)
+        month_ends = np.append(month_starts[1:], len(months) - 1)
+        for i, (start, end) in enumerate(zip(month_starts, month_ends)):
+            month_width = col_idxs[end] - col_idxs[start]
+            if month_width > 0 or i == len(month_starts) - 1:  # Only add label if there's space (always for the last)
+                ax.text(col_idxs[start] + month_width / 2, rows * 2 + 0.5, month_names[start], ha='center',
+                        va='bottom', fontsize=10, fontweight='bold', color='#666666')
+
+        # Add week label and count with improved visibility (label positions reuse the block positions)
+        if total_entries <= self.max_labeled_weeks:
+            week_labels = zip(block_x + 0.5, block_y, complete_weeks_sessions['week'].to_numpy(),
+                              complete_weeks_sessions['sessions'].to_numpy())
+            for x, y, week, sessions in week_labels:
+                ax.text(x, y + 1.1, f"Week {week}", ha='center', va='center', color='black', fontsize=9,
+                        fontweight='bold')
+                ax.text(x, y + 0.5, f"{int(sessions)} sessions", ha='center', va='center', color='black', fontsize=8)
+
+        # Add year label at the start of each row
+        for y, year in zip(row_start_y, years[col_idxs == 0]):
+            ax.text(-0.6, y + 0.75, str(year), ha='center', va='center', fontsize=11,
+                    fontweight='bold', bbox=dict(facecolor='white', edgecolor='none', alpha=0.8, pad=2))
 
         # Set the axis limits with padding
         ax.set_xlim(-1, weeks_per_row * 1.2)
@@ -138,12 +147,55 @@ class WorkoutBlocksVisualizer:
         for spine in ax.spines.values():
             spine.set_visible(False)
 
+        self._add_titles_and_legend(fig, ax, min_sessions)
+
+        return fig
+
+    def _create_compact_blocks(self, complete_weeks_sessions, min_sessions):
+        """Create unlabeled weekly blocks with one row of ISO weeks per year, for long histories"""
+        # Place each week by its position in the calendar year, so partial years line up by date
+        weeks = complete_weeks_sessions
+        years = np.sort(weeks['year'].unique())
+        block_x = (weeks['date'].dt.dayofyear.to_numpy() - 1) // 7
+        block_y = len(years) - 1 - np.searchsorted(years, weeks['year'].to_numpy())  # Earliest year on top
+
+        fig, ax = plt.subplots(figsize=(12, max(4, 0.5 * len(years) + 2)))
+        fig.subplots_adjust(left=0.08, right=0.95, top=0.8, bottom=0.2)
+        ax.add_collection(self._week_blocks(block_x, block_y, 0.85, 0.85, weeks['sessions'].to_numpy() >= min_sessions))
+
+        # Only label the years on the left
+        ax.set_xlim(-0.5, 53.5)
+        ax.set_ylim(-0.5, len(years))
+        ax.set_xticks([])
+        ax.set_yticks(len(years) - 1 - np.arange(len(years)) + 0.425, [str(year) for year in years],
+                      fontsize=10, fontweight='bold')
+        ax.tick_params(axis='y', length=0)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        self._add_titles_and_legend(fig, ax, min_sessions)
+
+        return fig
+
+    @staticmethod
+    def _week_blocks(x, y, width, height, hit_target):
+        """Build a collection of week rectangles colored by whether they hit the session target"""
+        hit_target = np.asarray(hit_target)[:, None]
+        return PolyCollection(
+            WorkoutBlocksVisualizer._rectangle_vertices(x, y, width, height),
+            facecolors=np.where(hit_target, to_rgba('#2ecc71', 0.8), to_rgba('#e74c3c', 0.6)),  # Bright green / red
+            edgecolors=np.where(hit_target, to_rgba('#333333', 0.8), to_rgba('#333333', 0.6)),  # Dark border
+            linewidths=0.5)
+
+    @staticmethod
+    def _add_titles_and_legend(fig, ax, min_sessions):
+        """Add the title, color explanation and legend shared by both weekly block layouts"""
         # Add title with better formatting
-        plt.suptitle('Weekly Workout Blocks', y=0.98, fontsize=16, fontweight='bold')
+        fig.suptitle('Weekly Workout Blocks', y=0.98, fontsize=16, fontweight='bold')
 
         # Add subtitle explaining colors with improved formatting
-        plt.title(f'Green: ≥{min_sessions} sessions | Red: <{min_sessions} sessions', pad=20, fontsize=14,
-                  color='#666666')
+        ax.set_title(f'Green: ≥{min_sessions} sessions | Red: <{min_sessions} sessions', pad=20, fontsize=14,
+                     color='#666666')
 
         # Add legend with clearer labels
         legend_elements = [
@@ -151,10 +203,19 @@ class WorkoutBlocksVisualizer:
             plt.Rectangle((0, 0), 1, 1, facecolor='#e74c3c', alpha=0.6, label=f'<{min_sessions} sessions')]
         ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.0, -0.05), fontsize=12, frameon=True)
 
-        return fig
+    @staticmethod
+    def _rectangle_vertices(x, y, width, height):
+        """Build an (N, 4, 2) array of rectangle corners from arrays of lower-left positions"""
+        corners = np.array([[0, 0], [width, 0], [width, height], [0, height]])
+        return np.stack([x, y], axis=-1)[:, None, :] + corners
+
+    def create_github_style_blocks(self, workout_data, weekly_sessions=None):
+        """Create GitHub-style weekly blocks with hover info
 
-    def create_github_style_blocks(self, workout_data):
-        """Create GitHub-style weekly blocks with hover info"""
+        Args:
+            workout_data: DataFrame of workout sets
+            weekly_sessions: Optional precomputed result of get_weekly_sessions(workout_data)
+        """
         # Check if workout_data is empty
         if workout_data.empty:
             # Create an empty Plotly figure with a message
@@ -201,19 +262,18 @@ class WorkoutBlocksVisualizer:
 
         # Create a complete date range with all weeks
         date_range = pd.date_range(start=min_date, end=max_date, freq='W-MON')  # Start weeks on Monday
+        months = date_range.month.to_numpy()
         complete_weeks = pd.DataFrame(
             {'date_start': date_range, 'date_end': date_range + pd.Timedelta(days=6), 'year': date_range.year,
-                'week': date_range.isocalendar().week, 'month': date_range.month,
-                'month_name': date_range.strftime('%b')})
+                'week': date_range.isocalendar().week.to_numpy(), 'month': months,
+                'month_name': _MONTH_ABBR[months - 1]})
 
         # Count sessions per week in actual data
-        workout_data['week'] = workout_data['date'].dt.isocalendar().week
-        workout_data['year'] = workout_data['date'].dt.isocalendar().year
-        weekly_sessions = workout_data.groupby(['year', 'week'])['date'].nunique().reset_index()
+        if weekly_sessions is None:
+            weekly_sessions = self.get_weekly_sessions(workout_data)
 
-        # Merge complete weeks with actual sessions
-        complete_weeks_sessions = complete_weeks.merge(weekly_sessions, on=['year', 'week'], how='left')
-        complete_weeks_sessions['date'] = complete_weeks_sessions['date'].fillna(0)
+        # Add the session count of each week
+        complete_weeks_sessions = complete_weeks.assign(sessions=self._get_week_sessions(complete_weeks, weekly_sessions))
 
         # Sort by year and week
         complete_weeks_sessions = complete_weeks_sessions.sort_values(['year', 'week'])
@@ -225,51 +285,41 @@ class WorkoutBlocksVisualizer:
             3: '#216e39'  # Dark green (6-7 workouts)
         }
 
-        # Create color and hover text arrays
-        color_array = []
-        hover_texts = []
-
         # Process data for visualization
         years = sorted(complete_weeks_sessions['year'].unique(), reverse=True)  # Sort years in reverse order
-        weeks_data = []
-
-        for year in years:
-            year_data = complete_weeks_sessions[complete_weeks_sessions['year'] == year]
-
-            # Create week blocks
-            for _, row in year_data.iterrows():
-                sessions = row['date']
-
-                # Determine color
-                if sessions == 0:
-                    color = colors[0]
-                elif sessions <= 2:
-                    color = colors[1]
-                elif sessions <= 5:
-                    color = colors[2]
-                else:
-                    color = colors[3]
-
-                color_array.append(color)
-
-                # Create hover text
-                date_range_str = f"{row['date_start'].strftime('%b %d')} - {row['date_end'].strftime('%b %d, %Y')}"
-                sessions_str = f"{int(sessions)} session{'s' if sessions != 1 else ''}"
-                hover_text = f"Week of {date_range_str}<br>{sessions_str}"
-                hover_texts.append(hover_text)
-
-                weeks_data.append(
-                    {'x': row['week'], 'y': year, 'color': color, 'hover_text': hover_text, 'sessions': sessions})
+        weeks = complete_weeks_sessions.sort_values(['year', 'week'], ascending=[False, True])
+        sessions = weeks['sessions'].to_numpy()
+
+        # Determine color levels (0, 1-2, 3-5 and 6+ workouts)
+        levels = np.digitize(sessions, bins=[1, 3, 6])
+
+        # Create hover texts
+        date_range_strs = weeks['date_start'].dt.strftime('%b %d') + ' - ' + weeks['date_end'].dt.strftime('%b %d, %Y')
+        hover_texts = [f"Week of {date_range_str}<br>{int(count)} session{'s' if count != 1 else ''}"
+                       for date_range_str, count in zip(date_range_strs, sessions)]
+
+        # Lay the weeks out as a (year x week) grid; weeks that don't exist in a year stay empty
+        week_numbers = np.arange(1, 54)
+        year_idx = np.searchsorted(-np.array(years), -weeks['year'].to_numpy())
+        week_idx = weeks['week'].to_numpy().astype(int) - 1
+        level_grid = np.full((len(years), len(week_numbers)), np.nan)
+        level_grid[year_idx, week_idx] = levels
+        hover_grid = np.full(level_grid.shape, None, dtype=object)
+        hover_grid[year_idx, week_idx] = hover_texts
+
+        # Map each level to its own color band
+        colorscale = []
+        for level in sorted(colors):
+            colorscale += [[level / len(colors), colors[level]], [(level + 1) / len(colors), colors[level]]]
 
         # Create the Plotly figure
         fig = go.Figure()
 
-        # Add squares for each week
-        for week in weeks_data:
-            fig.add_trace(
-                go.Scatter(x=[week['x']], y=[week['y']], mode='markers', marker=dict(size=20,  # Keep size consistent
-                    color=week['color'], symbol='square', line=dict(color='white', width=1)), text=week['hover_text'],
-                    hoverinfo='text', showlegend=False))
+        # Draw all weeks as a single heatmap
+        fig.add_trace(
+            go.Heatmap(z=level_grid, x=week_numbers, y=years, zmin=0, zmax=len(colors) - 1, colorscale=colorscale,
+                showscale=False, xgap=2, ygap=2,  # White gaps between squares
+                customdata=hover_grid, hovertemplate='%{customdata}<extra></extra>', hoverongaps=False))
 
         # Update layout with reduced spacing and reversed y-axis
         fig.update_layout(title='GitHub-Style Weekly Activity', plot_bgcolor='white', paper_bgcolor='white', height=300,
@@ -280,9 +330,9 @@ class WorkoutBlocksVisualizer:
             yaxis=dict(showgrid=False, zeroline=False, tickmode='array', ticktext=list(years),
                 # Years are already reversed
                 tickvals=list(years), # Add custom range to control spacing
-                range=[max(years) + 0.3, min(years) - 0.3],  # Reversed range for reversed order
+                range=[max(years) + 0.5, min(years) - 0.5],  # Reversed range for reversed order
                 scaleanchor='x',  # This makes the y-axis scale match the x-axis
-                scaleratio=1.5,  # This controls the aspect ratio (smaller = more compressed vertically)
+                scaleratio=1,  # Keep the heatmap cells square
                 constrain='domain'  # This ensures the scaling is maintained
             ))
 
@@ -1,12 +1,12 @@
 import streamlit as st
 import datetime
+import random
+import numpy as np
 
 # Import our modules
 from models.data_processor import DataProcessor
 from models.workout_analyzer import WorkoutAnalyzer
-from visualizations.calendar_view import CalendarVisualizer
-from visualizations.progression_charts import ProgressionVisualizer
-from visualizations.workout_blocks import WorkoutBlocksVisualizer
+from utils.calculations import calculate_workout_streaks
 
 # Set page config with wider layout and custom icon
 st.set_page_config(
@@ -179,6 +179,214 @@ def load_css():
     """, unsafe_allow_html=True)
 
 
+#######################
+# Cached Data Access
+#######################
+
+# The visualization modules (and with them Matplotlib and Plotly) are imported inside the functions that
+# build figures, so the sidebar and overview render before those imports on a cold start
+
+@st.cache_data(show_spinner="Loading workout data...", max_entries=2)
+def load_workout_data(input_version):
+    """Load and process all workout data, cached until the input files change"""
+    return DataProcessor().load_data()
+
+
+@st.cache_resource(max_entries=8)
+def get_filtered_data(filter_key, _combined_df, _dates):
+    """Apply the sidebar date range and app filters, cached per data version and filter selection
+    
+    Returns the filtered dataframe and the year of every filtered set.
+    """
+    _, (start_date, end_date), app_filter = filter_key
+    
+    # The dates are sorted, so the date range is a contiguous slice
+    start = np.searchsorted(_dates, np.datetime64(start_date), side='left')
+    end = np.searchsorted(_dates, np.datetime64(end_date + datetime.timedelta(days=1)), side='left')
+    date_filtered_df = _combined_df.iloc[start:end]
+    filtered_df = date_filtered_df[date_filtered_df['source'].isin(app_filter)]
+    return filtered_df, filtered_df['year'].to_numpy()
+
+
+@st.cache_data(max_entries=2)
+def get_workout_streaks(input_version, today, _dates):
+    """Get the current and longest workout streaks, cached per data version and day"""
+    return calculate_workout_streaks(np.unique(_dates.astype('datetime64[D]')), today)
+
+
+@st.cache_data(max_entries=16)
+def get_overview_statistics(filter_key, _filtered_df):
+    """Get (total workouts, unique exercises, avg sets per workout, workout days), cached per filter selection"""
+    # Sets per workout in one grouping pass; its length is also the number of workouts
+    sets_per_workout = _filtered_df.groupby('date', sort=False)['set_number'].max()
+    return (len(sets_per_workout), _filtered_df['exercise'].nunique(), round(sets_per_workout.mean(), 1),
+            len(sets_per_workout))
+
+
+@st.cache_data(max_entries=16)
+def get_volume_insights(filter_key, _filtered_df):
+    """Get (average volume, max volume, date of max volume) per workout, cached per filter selection"""
+    volume = _filtered_df['volume'] if 'volume' in _filtered_df else _filtered_df['weight'] * _filtered_df['reps']
+    volume_per_workout = volume.groupby(_filtered_df['date'], sort=False).sum()
+    return (int(volume_per_workout.mean()), int(volume_per_workout.max()),
+            volume_per_workout.idxmax().strftime('%Y-%m-%d'))
+
+
+@st.cache_data(max_entries=16)
+def get_exercise_details(filter_key, _filtered_df):
+    """Get exercise statistics, cached per data version and filter selection"""
+    return WorkoutAnalyzer().get_exercise_details(_filtered_df)
+
+
+@st.cache_data(max_entries=32)
+def search_exercise_details(filter_key, search_term, _filtered_df):
+    """Get the exercise statistics matching a search term and their CSV export, cached per filter and search"""
+    exercise_details = get_exercise_details(filter_key, _filtered_df)
+    
+    # Filter based on search term (a plain case-insensitive substring match)
+    if search_term:
+        exercise_names = exercise_details['Exercise'].str.lower()
+        exercise_details = exercise_details[exercise_names.str.contains(search_term.lower(), regex=False)]
+    return exercise_details, exercise_details.to_csv(index=False)
+
+
+@st.cache_data(max_entries=16)
+def get_exercise_list(filter_key, _filtered_df):
+    """Get the sorted exercise names for the selector, cached per data version and filter selection"""
+    return sorted(_filtered_df['exercise'].unique())
+
+
+@st.cache_data(max_entries=64)
+def get_top_sets(filter_key, exercise, _filtered_df):
+    """Get the top sets of an exercise, cached per filter selection and exercise"""
+    return WorkoutAnalyzer().get_top_sets(_filtered_df, exercise, 10)
+
+
+@st.cache_data(max_entries=16)
+def get_app_comparison(filter_key, _filtered_df):
+    """Get app comparison statistics, cached per data version and filter selection"""
+    return WorkoutAnalyzer().get_app_comparison(_filtered_df)
+
+
+@st.cache_data(max_entries=16)
+def get_year_range(filter_key, _filtered_years):
+    """Get the first and last workout year, cached per data version and filter selection"""
+    return int(_filtered_years.min()), int(_filtered_years.max())
+
+
+@st.cache_resource(max_entries=16)
+def get_calendar_heatmap(filter_key, year, _filtered_df, _filtered_years):
+    """Create the calendar heatmap, cached per filter selection and year"""
+    from visualizations.calendar_view import CalendarVisualizer
+
+    # Get unique workout dates for the selected year
+    workout_dates = _filtered_df.loc[_filtered_years == year, 'date'].unique()
+    return CalendarVisualizer().create_calendar_heatmap_plotly(workout_dates, year)
+
+
+@st.cache_data(max_entries=16)
+def get_weekly_sessions(filter_key, _filtered_df):
+    """Count sessions per ISO week, cached per data version and filter selection"""
+    from visualizations.workout_blocks import WorkoutBlocksVisualizer
+
+    return WorkoutBlocksVisualizer.get_weekly_sessions(_filtered_df)
+
+
+@st.cache_data(max_entries=16)
+def get_weekly_blocks(filter_key, min_sessions, _filtered_df, _weekly_sessions):
+    """Render the weekly blocks figure to PNG, cached per filter selection and session target
+    
+    st.pyplot rasterizes the figure again on every rerun, so the rendered image is cached instead.
+    """
+    import io
+    import matplotlib.pyplot as plt
+    from visualizations.workout_blocks import WorkoutBlocksVisualizer
+
+    fig = WorkoutBlocksVisualizer().create_weekly_blocks(_filtered_df, min_sessions, _weekly_sessions)
+    image = io.BytesIO()
+    # Same options st.pyplot uses, so the image looks the same
+    fig.savefig(image, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    return image.getvalue()
+
+
+@st.cache_resource(max_entries=16)
+def get_github_style_blocks(filter_key, _filtered_df, _weekly_sessions):
+    """Create the GitHub-style activity figure, cached per filter selection"""
+    from visualizations.workout_blocks import WorkoutBlocksVisualizer
+
+    return WorkoutBlocksVisualizer().create_github_style_blocks(_filtered_df, _weekly_sessions)
+
+
+@st.cache_resource(max_entries=16)
+def get_monthly_frequency_chart(filter_key, _filtered_df):
+    """Create the monthly frequency chart, cached per filter selection"""
+    from visualizations.progression_charts import ProgressionVisualizer
+
+    return ProgressionVisualizer().create_monthly_frequency_chart(_filtered_df)
+
+
+@st.cache_resource(max_entries=16)
+def get_weekly_frequency_chart(filter_key, _filtered_df):
+    """Create the weekly frequency chart, cached per filter selection"""
+    from visualizations.progression_charts import ProgressionVisualizer
+
+    return ProgressionVisualizer().create_weekly_frequency_chart(_filtered_df)
+
+
+@st.cache_resource(max_entries=16)
+def get_exercise_distribution_chart(filter_key, _filtered_df):
+    """Create the exercise distribution chart, cached per filter selection"""
+    from visualizations.progression_charts import ProgressionVisualizer
+
+    return ProgressionVisualizer().create_exercise_distribution_chart(_filtered_df)
+
+
+@st.cache_resource(max_entries=64)
+def get_exercise_progression_chart(filter_key, exercise, _filtered_df):
+    """Create the weight and 1RM progression chart, cached per filter selection and exercise"""
+    from visualizations.progression_charts import ProgressionVisualizer
+
+    return ProgressionVisualizer().create_exercise_progression_chart(_filtered_df, exercise)
+
+
+@st.cache_resource(max_entries=16)
+def get_volume_chart(filter_key, _filtered_df):
+    """Create the volume chart, cached per filter selection"""
+    from visualizations.progression_charts import ProgressionVisualizer
+
+    return ProgressionVisualizer().create_volume_chart(_filtered_df)
+
+
+#######################
+# Dashboard Content
+#######################
+
+# Motivational quotes
+MOTIVATIONAL_QUOTES = (
+    "The only bad workout is the one that didn't happen.",
+    "Your body can stand almost anything. It's your mind that you have to convince.",
+    "The pain you feel today will be the strength you feel tomorrow.",
+    "Fitness is not about being better than someone else. It's about being better than you used to be.",
+    "The hardest lift of all is lifting your butt off the couch.",
+    "You don't have to be extreme, just consistent.",
+    "No matter how slow you go, you're still lapping everyone on the couch.",
+    "Strength does not come from the physical capacity. It comes from an indomitable will.",
+    "The only place where success comes before work is in the dictionary.",
+    "Don't wish for it, work for it."
+)
+
+# Basic exercise tips dictionary (could be expanded)
+EXERCISE_TIPS = {
+    "bench press": "Focus on keeping your back arched and feet planted firmly on the ground. Lower the bar to your mid-chest.",
+    "squat": "Keep your chest up, back straight, and push through your heels. Go as low as your mobility allows.",
+    "deadlift": "Start with the bar over mid-foot, grab the bar, bend knees until shins touch the bar, lift chest and pull.",
+    "overhead press": "Keep your core tight and avoid arching your back. Press straight up overhead.",
+    "pull up": "Start from a dead hang and pull until your chin is over the bar. Focus on engaging your lats.",
+    "barbell row": "Hinge at the hips, keep your back straight, and pull the bar to your lower chest.",
+}
+
+
 #######################
 # Main Dashboard Class
 #######################
@@ -189,31 +397,16 @@ class WorkoutDashboard:
         # Initialize data processor
         self.data_processor = DataProcessor()
 
-        # Load data
-        self.combined_df, self.hevy_df, self.strong_df, self.jefit_df = self.data_processor.load_data()
+        # Load data (parsed once and reused across reruns until the input files change)
+        self.combined_df, self.hevy_df, self.strong_df, self.jefit_df = load_workout_data(
+            self.data_processor.get_input_version())
 
-        # Initialize analyzers and visualizers
-        self.analyzer = WorkoutAnalyzer(self.combined_df)
-        self.calendar_viz = CalendarVisualizer()
-        self.blocks_viz = WorkoutBlocksVisualizer()
-        self.progression_viz = ProgressionVisualizer()
+        # Date column as an array for slicing by date (the processor returns the data sorted by date)
+        self.dates = self.combined_df['date'].to_numpy()
 
-        # Initialize filtered dataframe
+        # Initialize filtered dataframe and the key identifying it for cached results
         self.filtered_df = self.combined_df
-        
-        # Motivational quotes
-        self.quotes = [
-            "The only bad workout is the one that didn't happen.",
-            "Your body can stand almost anything. It's your mind that you have to convince.",
-            "The pain you feel today will be the strength you feel tomorrow.",
-            "Fitness is not about being better than someone else. It's about being better than you used to be.",
-            "The hardest lift of all is lifting your butt off the couch.",
-            "You don't have to be extreme, just consistent.",
-            "No matter how slow you go, you're still lapping everyone on the couch.",
-            "Strength does not come from the physical capacity. It comes from an indomitable will.",
-            "The only place where success comes before work is in the dictionary.",
-            "Don't wish for it, work for it."
-        ]
+        self.filter_key = (self.combined_df.attrs.get('version'), None, None)
 
     def render_sidebar(self):
         """Render the sidebar with filters and controls"""
@@ -221,6 +414,8 @@ class WorkoutDashboard:
         
         # Add file upload section
         st.sidebar.header("Upload Workout Data")
+        if 'upload_message' in st.session_state:
+            st.sidebar.success(f"{st.session_state.pop('upload_message')} Data refreshed with new uploads!")
         with st.sidebar.expander("Upload New Data", expanded=False):
             uploaded_file = st.file_uploader("Upload workout data (CSV)", type=['csv'])
             
@@ -231,15 +426,9 @@ class WorkoutDashboard:
                         file_path, message = self.data_processor.save_uploaded_file(uploaded_file)
                         
                         if file_path:
-                            st.success(f"File uploaded successfully! {message}")
-                            st.info("Refreshing data... please wait.")
-                            # Reload data to include the new file
-                            self.combined_df, self.hevy_df, self.strong_df, self.jefit_df = self.data_processor.load_data()
-                            # Update the analyzer with new data
-                            self.analyzer = WorkoutAnalyzer(self.combined_df)
-                            # Update filtered dataframe
-                            self.filtered_df = self.combined_df.copy()
-                            st.success("Data refreshed with new uploads!")
+                            # The new file changes the input version, so the rerun loads fresh data
+                            st.session_state['upload_message'] = f"File uploaded successfully! {message}"
+                            st.rerun()
                         else:
                             st.error(f"Error processing file: {message}")
             
@@ -252,9 +441,9 @@ class WorkoutDashboard:
             The system will automatically detect the format based on the file structure.
             """)
 
-        # Date range filter with better UI
-        min_date = self.combined_df['date'].min().date()
-        max_date = self.combined_df['date'].max().date()
+        # Date range filter with better UI (the data is sorted by date)
+        min_date = self.combined_df['date'].iloc[0].date()
+        max_date = self.combined_df['date'].iloc[-1].date()
         
         col1, col2 = st.sidebar.columns(2)
         with col1:
@@ -281,19 +470,19 @@ class WorkoutDashboard:
         if not app_filter:  # If nothing selected, select all
             app_filter = ['Hevy', 'Strong', 'Jefit']
 
-        # Apply filters
-        self.filtered_df = self.combined_df[(self.combined_df['date'].dt.date >= date_range[0]) & 
-                                           (self.combined_df['date'].dt.date <= date_range[1]) & 
-                                           (self.combined_df['source'].isin(app_filter))]
+        # Apply filters (reused as long as the data and the selection are unchanged)
+        self.filter_key = (self.combined_df.attrs.get('version'), date_range, tuple(app_filter))
+        self.filtered_df, self.filtered_years = get_filtered_data(self.filter_key, self.combined_df, self.dates)
         
         # Show a random motivational quote
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 💪 Daily Motivation")
-        import random
-        quote = random.choice(self.quotes)
+        # Pick the quote once per session so it doesn't change on every interaction
+        if 'daily_quote' not in st.session_state:
+            st.session_state.daily_quote = random.choice(MOTIVATIONAL_QUOTES)
         st.sidebar.markdown(f"""
         <div class="quote-container">
-            "{quote}"
+            "{st.session_state.daily_quote}"
         </div>
         """, unsafe_allow_html=True)
         
@@ -301,36 +490,10 @@ class WorkoutDashboard:
         st.sidebar.markdown("---")
         st.sidebar.markdown("### 🔥 Your Workout Streak")
         
-        # Calculate current streak
-        workout_dates = sorted(self.combined_df['date'].dt.date.unique())
-        
-        if workout_dates:
+        # Calculate current and max streak
+        if len(self.dates):
             today = datetime.datetime.now().date()
-            current_streak = 0
-            
-            # Check if worked out today
-            if today in workout_dates:
-                current_streak = 1
-                check_date = today - datetime.timedelta(days=1)
-            else:
-                check_date = today
-                
-            # Count backwards until streak breaks
-            while check_date in workout_dates:
-                if current_streak > 0 or check_date == today:  # Only increment if already started or today
-                    current_streak += 1
-                check_date -= datetime.timedelta(days=1)
-                
-            # Calculate max streak
-            max_streak = 1
-            current_max = 1
-            
-            for i in range(1, len(workout_dates)):
-                if (workout_dates[i] - workout_dates[i-1]).days == 1:
-                    current_max += 1
-                else:
-                    current_max = 1
-                max_streak = max(max_streak, current_max)
+            current_streak, max_streak = get_workout_streaks(self.combined_df.attrs.get('version'), today, self.dates)
                 
             # Display streak info
             st.sidebar.markdown(f"""
@@ -366,11 +529,13 @@ class WorkoutDashboard:
             st.warning("⚠️ No workout data available for the selected filters. Try adjusting your filter settings.")
             return
             
+        total_workouts, unique_exercises, avg_sets, total_days = get_overview_statistics(self.filter_key,
+                                                                                          self.filtered_df)
+
         # Create metrics with improved styling
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            total_workouts = len(self.filtered_df.groupby('date').first())
             st.markdown(f"""
             <div class="metric-card">
                 <div class="metric-value">{total_workouts}</div>
@@ -379,7 +544,6 @@ class WorkoutDashboard:
             """, unsafe_allow_html=True)
             
         with col2:
-            unique_exercises = self.filtered_df['exercise'].nunique()
             st.markdown(f"""
             <div class="metric-card">
                 <div class="metric-value">{unique_exercises}</div>
@@ -388,7 +552,6 @@ class WorkoutDashboard:
             """, unsafe_allow_html=True)
             
         with col3:
-            avg_sets = round(self.filtered_df.groupby('date')['set_number'].max().mean(), 1)
             st.markdown(f"""
             <div class="metric-card">
                 <div class="metric-value">{avg_sets}</div>
@@ -397,7 +560,6 @@ class WorkoutDashboard:
             """, unsafe_allow_html=True)
             
         with col4:
-            total_days = self.filtered_df['date'].nunique()
             st.markdown(f"""
             <div class="metric-card">
                 <div class="metric-value">{total_days}</div>
@@ -410,17 +572,15 @@ class WorkoutDashboard:
         st.markdown("## 📅 Workout Calendar")
         st.markdown("Track your workout consistency throughout the year")
         
+        min_year, max_year = get_year_range(self.filter_key, self.filtered_years)
         calendar_year = st.slider("Select Year", 
-                                 min_value=self.filtered_df['date'].dt.year.min(),
-                                 max_value=self.filtered_df['date'].dt.year.max(),
-                                 value=self.filtered_df['date'].dt.year.max())
+                                 min_value=min_year,
+                                 max_value=max_year,
+                                 value=max_year)
 
-        # Get unique workout dates for the selected year
-        workout_dates = self.filtered_df[self.filtered_df['date'].dt.year == calendar_year]['date'].unique()
-
-        # Create and display the calendar
-        calendar_fig = self.calendar_viz.create_calendar_heatmap(workout_dates, calendar_year)
-        st.pyplot(calendar_fig)
+        # Create and display the calendar (the year's workout dates are only collected when it isn't cached)
+        calendar_fig = get_calendar_heatmap(self.filter_key, calendar_year, self.filtered_df, self.filtered_years)
+        st.plotly_chart(calendar_fig, use_container_width=True)
 
     def display_weekly_blocks(self):
         """Display weekly blocks section"""
@@ -435,14 +595,17 @@ class WorkoutDashboard:
             st.markdown("### Weekly Overview")
             st.markdown("Green blocks indicate weeks where you hit your target number of workouts")
 
+        # Count sessions per week once for both weekly block views
+        weekly_sessions = get_weekly_sessions(self.filter_key, self.filtered_df)
+
         # Create and display the weekly blocks
-        weekly_blocks_fig = self.blocks_viz.create_weekly_blocks(self.filtered_df, min_sessions)
-        st.pyplot(weekly_blocks_fig)
+        weekly_blocks_image = get_weekly_blocks(self.filter_key, min_sessions, self.filtered_df, weekly_sessions)
+        st.image(weekly_blocks_image, use_column_width=True)
 
         # GitHub-Style Weekly Activity
         st.markdown("### GitHub-Style Activity")
         st.markdown("Your workout activity displayed similar to GitHub contributions")
-        github_blocks_fig = self.blocks_viz.create_github_style_blocks(self.filtered_df)
+        github_blocks_fig = get_github_style_blocks(self.filter_key, self.filtered_df, weekly_sessions)
         st.plotly_chart(github_blocks_fig, use_container_width=True)
 
     def display_workout_frequency(self):
@@ -456,13 +619,13 @@ class WorkoutDashboard:
         with col1:
             # Monthly view
             st.markdown("### Monthly Frequency")
-            monthly_fig = self.progression_viz.create_monthly_frequency_chart(self.filtered_df)
+            monthly_fig = get_monthly_frequency_chart(self.filter_key, self.filtered_df)
             st.plotly_chart(monthly_fig, use_container_width=True)
 
         with col2:
             # Weekly view
             st.markdown("### Weekly Frequency")
-            weekly_fig = self.progression_viz.create_weekly_frequency_chart(self.filtered_df)
+            weekly_fig = get_weekly_frequency_chart(self.filter_key, self.filtered_df)
             st.plotly_chart(weekly_fig, use_container_width=True)
 
     def display_exercise_distribution(self):
@@ -470,7 +633,7 @@ class WorkoutDashboard:
         st.markdown("## 🏋️ Exercise Distribution")
         st.markdown("See which exercises you perform most frequently")
         
-        exercise_fig = self.progression_viz.create_exercise_distribution_chart(self.filtered_df)
+        exercise_fig = get_exercise_distribution_chart(self.filter_key, self.filtered_df)
         st.plotly_chart(exercise_fig, use_container_width=True)
 
     def display_exercise_analysis(self):
@@ -478,12 +641,12 @@ class WorkoutDashboard:
         st.markdown("## 💪 Exercise Analysis")
         st.markdown("Dive deep into your performance for specific exercises")
         
-        if self.filtered_df.empty or self.filtered_df['exercise'].nunique() == 0:
+        # Add exercise categories for better organization
+        exercise_list = get_exercise_list(self.filter_key, self.filtered_df)
+        
+        if self.filtered_df.empty or not exercise_list:
             st.warning("⚠️ No exercise data available for the selected filters.")
             return
-            
-        # Add exercise categories for better organization
-        exercise_list = sorted(self.filtered_df['exercise'].unique())
         
         # Create a more user-friendly exercise selector
         col1, col2 = st.columns([3, 1])
@@ -497,7 +660,7 @@ class WorkoutDashboard:
         
         with col2:
             st.markdown("<br>", unsafe_allow_html=True)  # Add spacing
-            exercise_count = self.filtered_df[self.filtered_df['exercise'] == selected_exercise].shape[0]
+            exercise_count = (self.filtered_df['exercise'] == selected_exercise).sum()
             st.markdown(f"**{exercise_count}** sets performed")
 
         # Create two columns for the exercise analysis
@@ -506,34 +669,23 @@ class WorkoutDashboard:
         with col1:
             # Top 10 Sets with improved styling
             st.markdown("### 🏆 Top 10 Sets")
-            top_sets_display = self.analyzer.get_top_sets(self.filtered_df, selected_exercise, 10)
+            top_sets_display = get_top_sets(self.filter_key, selected_exercise, self.filtered_df)
             st.dataframe(top_sets_display, use_container_width=True)
 
         with col2:
             # Weight and 1RM Progression
             st.markdown("### 📈 Weight and 1RM Progression")
-            progression_fig = self.progression_viz.create_exercise_progression_chart(self.filtered_df,
-                                                                                   selected_exercise)
+            progression_fig = get_exercise_progression_chart(self.filter_key, selected_exercise, self.filtered_df)
             st.plotly_chart(progression_fig, use_container_width=True)
             
         # Add exercise tips section
         st.markdown("### 💡 Exercise Tips")
         
-        # Basic exercise tips dictionary (could be expanded)
-        exercise_tips = {
-            "bench press": "Focus on keeping your back arched and feet planted firmly on the ground. Lower the bar to your mid-chest.",
-            "squat": "Keep your chest up, back straight, and push through your heels. Go as low as your mobility allows.",
-            "deadlift": "Start with the bar over mid-foot, grab the bar, bend knees until shins touch the bar, lift chest and pull.",
-            "overhead press": "Keep your core tight and avoid arching your back. Press straight up overhead.",
-            "pull up": "Start from a dead hang and pull until your chin is over the bar. Focus on engaging your lats.",
-            "barbell row": "Hinge at the hips, keep your back straight, and pull the bar to your lower chest.",
-        }
-        
         # Display a tip if available for the selected exercise, or a generic tip
         selected_exercise_lower = selected_exercise.lower()
         tip = "No specific tips available for this exercise. Focus on proper form and controlled movements."
         
-        for key, value in exercise_tips.items():
+        for key, value in EXERCISE_TIPS.items():
             if key in selected_exercise_lower:
                 tip = value
                 break
@@ -545,21 +697,13 @@ class WorkoutDashboard:
         st.markdown("## 📊 Volume Analysis")
         st.markdown("Track your total workout volume over time (Weight × Reps)")
         
-        volume_fig = self.progression_viz.create_volume_chart(self.filtered_df)
+        volume_fig = get_volume_chart(self.filter_key, self.filtered_df)
         st.plotly_chart(volume_fig, use_container_width=True)
         
         # Add volume insights
         if not self.filtered_df.empty:
-            # Calculate volume per workout
-            volume_data = self.filtered_df.groupby('date').apply(
-                lambda x: (x['weight'] * x['reps']).sum()
-            ).reset_index()
-            volume_data.columns = ['date', 'volume']
-            
-            # Get insights
-            avg_volume = int(volume_data['volume'].mean())
-            max_volume = int(volume_data['volume'].max())
-            max_volume_date = volume_data.loc[volume_data['volume'].idxmax(), 'date'].strftime('%Y-%m-%d')
+            # Get insights from the volume per workout
+            avg_volume, max_volume, max_volume_date = get_volume_insights(self.filter_key, self.filtered_df)
             
             # Display insights
             col1, col2 = st.columns(2)
@@ -592,18 +736,14 @@ class WorkoutDashboard:
         # Add search functionality
         search_term = st.text_input("Search for exercises:", "")
         
-        exercise_details = self.analyzer.get_exercise_details(self.filtered_df)
-        
-        # Filter based on search term
-        if search_term:
-            exercise_details = exercise_details[exercise_details['Exercise'].str.contains(search_term, case=False)]
+        # Matching rows and their CSV export are reused until the filters or the search term change
+        exercise_details, csv = search_exercise_details(self.filter_key, search_term, self.filtered_df)
         
         # Display the data with improved styling
         st.dataframe(exercise_details, use_container_width=True)
         
         # Add export functionality
         if not exercise_details.empty:
-            csv = exercise_details.to_csv(index=False)
             st.download_button(
                 label="Download Exercise Data as CSV",
                 data=csv,
@@ -616,7 +756,7 @@ class WorkoutDashboard:
         st.markdown("## 📱 App Comparison")
         st.markdown("Compare statistics across different workout tracking apps")
         
-        app_stats = self.analyzer.get_app_comparison(self.filtered_df)
+        app_stats = get_app_comparison(self.filter_key, self.filtered_df)
         
         # Create a more visual representation
         if not app_stats.empty: